@@ -3,8 +3,15 @@ from discord.ext import commands, tasks
 from discord import app_commands
 from dotenv import load_dotenv
 import os
-import json
-from datetime import datetime, date, timedelta
+import re
+import orjson
+import asyncio
+import functools
+import bisect
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, date, time, timedelta
 
 # ================== CONFIG / TOKEN ==================
 
@@ -22,8 +29,19 @@ bot = commands.Bot(command_prefix="!", intents=intents)  # prefix unused, we use
 # ================== REMINDER STORAGE ==================
 
 REMINDERS_FILE = "reminders.json"
-
-# Reminder structure:
+# Changes since the last full write of REMINDERS_FILE, one JSON record per line:
+#   {"op": "add", "rem": {...}}  or  {"op": "del", "id": int}
+JOURNAL_FILE = "reminders.log"
+# Read buffer for loading the files; large reads mean fewer syscalls
+READ_BUFFER_SIZE = 1 << 20
+# Rewrite REMINDERS_FILE (and empty the journal) after this many changes
+SNAPSHOT_EVERY = 100
+# Changes made within this many seconds are written to the journal together
+SAVE_DELAY = 0.5
+# Seconds to wait before retrying a failed journal or snapshot write
+SAVE_RETRY_DELAY = 5
+
+# Reminder structure in the JSON files:
 # {
 #   "id": int,
 #   "guild_id": int | null,
@@ -35,43 +53,384 @@ REMINDERS_FILE = "reminders.json"
 #   "days_before": int
 # }
 
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(s: str) -> date:
+    # Fixed YYYY-MM-DD format, so slice it instead of going through strptime
+    if len(s) != 10 or s[4] != "-" or s[7] != "-":
+        raise ValueError(f"invalid date: {s!r}")
+    year, month, day = s[0:4], s[5:7], s[8:10]
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        raise ValueError(f"invalid date: {s!r}")
+    return date(int(year), int(month), int(day))
+
+
+def _parse_event_date(s):
+    try:
+        return _parse_iso_date(s)
+    except (TypeError, ValueError):
+        return None
+
+
+def _replay_journal(loaded):
+    if not os.path.exists(JOURNAL_FILE):
+        return loaded
+
+    # Replay into a dict keyed by id, so each record is O(1). An "add" for
+    # an id the snapshot already has (we crashed between writing the
+    # snapshot and emptying the journal) just replaces it. Old entries
+    # without an id can't be touched by the journal and are kept as is.
+    by_id = {}
+    without_id = []
+    for r in loaded:
+        if isinstance(r, dict) and "id" in r:
+            by_id[r["id"]] = r
+        else:
+            without_id.append(r)
+
+    with open(JOURNAL_FILE, "rb", buffering=READ_BUFFER_SIZE) as f:
+        for line in f:
+            try:
+                record = orjson.loads(line)
+                if record["op"] == "add":
+                    rem = record["rem"]
+                    by_id[rem["id"]] = rem
+                elif record["op"] == "del":
+                    by_id.pop(record["id"], None)
+            except (ValueError, KeyError, TypeError):
+                # Cut short by a crash mid-write, or otherwise malformed;
+                # skip just this record
+                print(f"Skipping bad record in {JOURNAL_FILE}: {line!r}")
+                continue
+
+    return without_id + list(by_id.values())
+
+
+@dataclass(slots=True)
+class Reminder:
+    """
+    In-memory reminder. The fields after days_before are derived from the
+    others when created and are never saved.
+    """
+
+    id: int
+    guild_id: int | None
+    channel_id: int
+    author_id: int | None
+    name: str
+    date_str: str
+    repeat: str
+    days_before: int
+
+    # Parsed date_str, or None if it is invalid
+    event_date: date | None = field(init=False, repr=False, compare=False)
+    # Message templates with a "{date}" slot
+    early_text: str = field(init=False, repr=False, compare=False)
+    day_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.event_date = _parse_event_date(self.date_str)
+
+        mention = f"<@{self.author_id}>" if self.author_id else ""
+        # Escape braces so the name survives str.format
+        name = self.name.replace("{", "{{").replace("}", "}}")
+
+        # The date is filled in when sending, since yearly reminders change year
+        self.early_text = (
+            f"⏰ {mention} Early reminder "
+            f"({self.days_before} days ahead): **{name}** on **{{date}}**"
+        )
+        self.day_text = f"🎉 {mention} Today is **{name}**! (**{{date}}**)"
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            id=d["id"],
+            guild_id=d.get("guild_id"),
+            channel_id=d["channel_id"],
+            author_id=d.get("author_id"),
+            name=d.get("name", "Unnamed event"),
+            date_str=d.get("date", ""),
+            repeat=d.get("repeat", "once"),
+            days_before=d.get("days_before", 0),
+        )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "guild_id": self.guild_id,
+            "channel_id": self.channel_id,
+            "author_id": self.author_id,
+            "name": self.name,
+            "date": self.date_str,
+            "repeat": self.repeat,
+            "days_before": self.days_before,
+        }
+
+
 def load_reminders():
-    if not os.path.exists(REMINDERS_FILE):
-        return []
+    loaded = []
+    if os.path.exists(REMINDERS_FILE):
+        try:
+            with open(REMINDERS_FILE, "rb", buffering=READ_BUFFER_SIZE) as f:
+                loaded = orjson.loads(f.read())
+        except Exception:
+            loaded = []
+
     try:
-        with open(REMINDERS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return []
+        loaded = _replay_journal(loaded)
+    except OSError as e:
+        # Startup rewrites the snapshot and empties the journal, so move
+        # it aside rather than lose the changes in it
+        print(f"Error replaying {JOURNAL_FILE}, moving it to {JOURNAL_FILE}.bad: {e}")
+        try:
+            os.replace(JOURNAL_FILE, JOURNAL_FILE + ".bad")
+        except OSError:
+            pass
+
+    return loaded
+
+
+_journal_entries = 0
+# Journal records not yet written to disk (see journal_writer)
+_pending_records = []
+_dirty = asyncio.Event()
+
+
+def _write_snapshot(persisted):
+    # Write to a temp file and swap it in, so a crash never leaves a
+    # half-written snapshot behind
+    tmp_file = REMINDERS_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(persisted))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, REMINDERS_FILE)
+    with open(JOURNAL_FILE, "wb"):
+        pass
+
+
+def _append_journal(data):
+    with open(JOURNAL_FILE, "ab") as f:
+        f.write(data)
 
 
 def save_reminders(reminders_list):
-    with open(REMINDERS_FILE, "w", encoding="utf-8") as f:
-        json.dump(reminders_list, f, indent=4)
+    """
+    Write the full snapshot. Everything in the journal (written or still
+    pending) is now part of it, so the journal is emptied.
+    This blocks, so it is only used outside the event loop (startup and
+    shutdown); the running bot goes through flush_journal.
+    """
+    global _journal_entries
+
+    _write_snapshot([r.to_dict() for r in reminders_list])
+    _journal_entries = 0
+    _pending_records.clear()
+
+
+async def flush_journal():
+    """
+    Write pending journal records, and the snapshot when one is due.
+    The file I/O runs in a worker thread so the event loop (gateway
+    heartbeats, slash commands) is never blocked on disk.
+    """
+    global _journal_entries
+
+    if _pending_records:
+        records = _pending_records[:]
+        _pending_records.clear()
+        data = b"".join(orjson.dumps(r) + b"\n" for r in records)
+        try:
+            await asyncio.to_thread(_append_journal, data)
+        except Exception:
+            # Put them back so the retry in journal_writer writes them
+            _pending_records[:0] = records
+            raise
+        _journal_entries += len(records)
 
+    # Also reached with nothing pending when retrying a failed snapshot
+    if _journal_entries >= SNAPSHOT_EVERY:
+        # Copied here, on the event loop, so the thread never sees a
+        # half-applied change. Changes made while it writes stay queued and
+        # land in the emptied journal (replaying them again is harmless).
+        persisted = [r.to_dict() for r in reminders.values()]
+        await asyncio.to_thread(_write_snapshot, persisted)
+        _journal_entries = 0
 
-reminders = load_reminders()
 
-# Compute next_id and assign IDs to any old reminders missing "id"
+def _journal(record):
+    _pending_records.append(record)
+    _dirty.set()
+
+
+def journal_add(rem):
+    _journal({"op": "add", "rem": rem.to_dict()})
+
+
+def journal_delete(rem):
+    _journal({"op": "del", "id": rem.id})
+
+
+loaded = load_reminders()
+
+# Compute next_id and assign IDs to any old reminders missing "id".
+# IDs must be unique, since reminders are stored keyed by them.
+current_max_id = max((r["id"] for r in loaded if "id" in r), default=0)
+for r in loaded:
+    if "id" not in r:
+        current_max_id += 1
+        r["id"] = current_max_id
+next_id = current_max_id + 1
+
+# Reminders keyed by "id"
+reminders = {r["id"]: Reminder.from_dict(r) for r in loaded}
 if reminders:
-    current_max_id = 0
-    for r in reminders:
-        if "id" not in r:
-            current_max_id += 1
-            r["id"] = current_max_id
+    save_reminders(reminders.values())
+
+
+# ================== INDEXES ==================
+
+# Reminders keyed by "author_id", each list sorted by _author_sort_key
+_by_author = defaultdict(list)
+# Min-heap of upcoming triggers: (trigger date, reminder id, is_early).
+# Deleted reminders are not removed from it, their entries are skipped
+# when popped.
+_schedule = []
+
+
+def _author_sort_key(rem):
+    return (rem.date_str, rem.id)
+
+
+def _next_yearly_trigger(event_date, offset, after):
+    """
+    First date on or after `after` that is `offset` days before an
+    anniversary of `event_date`, or None if there is none before date.max.
+    """
+    for year in range(after.year, date.max.year + 1):
+        try:
+            trigger = date(year, event_date.month, event_date.day) - timedelta(days=offset)
+        except (ValueError, OverflowError):
+            # Feb 29 in a non-leap year, or offset reaches before date.min
+            continue
+        if trigger >= after:
+            return trigger
+    return None
+
+
+def _trigger_entry(rem, early, after):
+    """
+    The _schedule entry for the next early or day-of trigger of `rem` on or
+    after `after`, or None if there is none.
+    """
+    event_date = rem.event_date
+    offset = rem.days_before if early else 0
+
+    if rem.repeat == "yearly":
+        trigger = _next_yearly_trigger(event_date, offset, after)
+    else:
+        try:
+            trigger = event_date - timedelta(days=offset)
+        except OverflowError:
+            trigger = None
+
+    if trigger is None or trigger < after:
+        return None
+    return (trigger, rem.id, early)
+
+
+def _schedule_entries(rem, today):
+    if rem.event_date is None or rem.repeat not in ("once", "yearly"):
+        return []
+
+    entries = [_trigger_entry(rem, False, today)]
+    if rem.days_before > 0:
+        entries.append(_trigger_entry(rem, True, today))
+    return [e for e in entries if e is not None]
+
+
+def _build_indexes():
+    """
+    Index every loaded reminder at once: one sort per author and a single
+    heapify, instead of an insort and heappush per reminder.
+    """
+    today = date.today()
+    for rem in reminders.values():
+        _by_author[rem.author_id].append(rem)
+        _schedule.extend(_schedule_entries(rem, today))
+
+    for author_rems in _by_author.values():
+        author_rems.sort(key=_author_sort_key)
+    heapq.heapify(_schedule)
+
+
+def _index_reminder(rem):
+    bisect.insort(_by_author[rem.author_id], rem, key=_author_sort_key)
+    for entry in _schedule_entries(rem, date.today()):
+        heapq.heappush(_schedule, entry)
+
+
+def _unindex_reminder(rem):
+    author_rems = _by_author.get(rem.author_id)
+    if author_rems is not None:
+        for i, r in enumerate(author_rems):
+            if r is rem:
+                del author_rems[i]
+                break
+        if not author_rems:
+            del _by_author[rem.author_id]
+
+
+def _reschedule(rem, early, trigger):
+    """
+    Done with `trigger`: yearly reminders get their next year's trigger.
+    """
+    if rem.repeat == "yearly":
+        entry = _trigger_entry(rem, early, trigger + timedelta(days=1))
+        if entry is not None:
+            heapq.heappush(_schedule, entry)
+
+
+def _due_reminders(today):
+    """
+    Pop everything scheduled up to today and return (reminder, trigger,
+    is_early) for what fires today. The caller either re-pushes the entry
+    to retry it or calls _reschedule once it is sent.
+    """
+    due = []
+
+    while _schedule and _schedule[0][0] <= today:
+        trigger, rem_id, early = heapq.heappop(_schedule)
+        rem = reminders.get(rem_id)
+        if rem is None:
+            continue
+
+        if trigger == today:
+            due.append((rem, trigger, early))
         else:
-            current_max_id = max(current_max_id, r["id"])
-    next_id = current_max_id + 1
-    save_reminders(reminders)
-else:
-    next_id = 1
+            # Missed (the bot was offline, or it kept failing all day)
+            kind = "early reminder" if early else "reminder"
+            print(
+                f"Missed {kind} for ID {rem.id} ({rem.name}) on "
+                f"{trigger.isoformat()} in channel {rem.channel_id}"
+            )
+            _reschedule(rem, early, trigger)
+
+    return due
+
+
+_build_indexes()
 
 
 # ================== EVENTS ==================
 
 @bot.event
-async def on_ready():
-    print(f"Logged in as {bot.user} (ID: {bot.user.id})")
+async def setup_hook():
+    # Runs once after login, before connecting to the gateway. on_ready can
+    # fire again on every reconnect, so one-time setup belongs here.
 
     # Sync slash commands with Discord
     try:
@@ -80,9 +439,16 @@ async def on_ready():
     except Exception as e:
         print(f"Error syncing commands: {e}")
 
-    # Start reminder loop
-    if not reminder_loop.is_running():
-        reminder_loop.start()
+    # Start reminder loop (it waits for the bot to be ready itself)
+    reminder_loop.start()
+
+    # Start journal writer
+    journal_writer.start()
+
+
+@bot.event
+async def on_ready():
+    print(f"Logged in as {bot.user} (ID: {bot.user.id})")
 
 
 # ================== SLASH COMMANDS ==================
@@ -115,10 +481,16 @@ async def slash_reminder(
     """
     global next_id
 
-    # Parse date
-    try:
-        event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-    except ValueError:
+    # Parse date. Check the shape first so malformed input skips the
+    # exception path; the parse then only catches impossible dates (2025-02-30).
+    event_date = None
+    if _DATE_RE.fullmatch(date_str):
+        try:
+            event_date = _parse_iso_date(date_str)
+        except ValueError:
+            pass
+
+    if event_date is None:
         await interaction.response.send_message(
             "❌ Use date format: `YYYY-MM-DD` (e.g. 2025-12-31).",
             ephemeral=True,
@@ -134,35 +506,43 @@ async def slash_reminder(
 
     repeat_value = repeat.value  # "once" or "yearly"
 
-    reminder = {
-        "id": next_id,
-        "guild_id": interaction.guild_id,
-        "channel_id": interaction.channel_id,
-        "author_id": interaction.user.id,
-        "name": name,
-        "date": event_date.isoformat(),
-        "repeat": repeat_value,
-        "days_before": int(days_before),
-    }
+    # Take the id before any await, so concurrent calls can't share it
+    reminder_id = next_id
+    next_id += 1
 
-    reminders.append(reminder)
-    save_reminders(reminders)
+    reminder = Reminder(
+        id=reminder_id,
+        guild_id=interaction.guild_id,
+        channel_id=interaction.channel_id,
+        author_id=interaction.user.id,
+        name=name,
+        date_str=event_date.isoformat(),
+        repeat=repeat_value,
+        days_before=int(days_before),
+    )
+
+    reminders[reminder.id] = reminder
+    _index_reminder(reminder)
+    journal_add(reminder)
+
+    # reminder_loop is asleep until midnight, wake it if this fires today
+    if _schedule and _schedule[0][0] <= date.today():
+        _wakeup.set()
 
     await interaction.response.send_message(
-        f"✅ Reminder saved (ID: `{next_id}`):\n"
+        f"✅ Reminder saved (ID: `{reminder.id}`):\n"
         f"- **Name:** {name}\n"
         f"- **Date:** {event_date.isoformat()}\n"
         f"- **Repeat:** {repeat_value}\n"
         f"- **Early reminder:** {days_before} day(s) before"
     )
 
-    next_id += 1
-
 
 @bot.tree.command(name="myreminders", description="List your reminders")
 async def slash_myreminders(interaction: discord.Interaction):
     user_id = interaction.user.id
-    user_rems = [r for r in reminders if r.get("author_id") == user_id]
+    # Already sorted by date, then id
+    user_rems = _by_author.get(user_id, [])
 
     if not user_rems:
         await interaction.response.send_message(
@@ -172,11 +552,11 @@ async def slash_myreminders(interaction: discord.Interaction):
 
     # Build a text list
     lines = []
-    for r in sorted(user_rems, key=lambda x: (x.get("date", ""), x.get("id", 0))):
+    for r in user_rems:
         lines.append(
-            f"ID: `{r['id']}` | **{r['name']}** | Date: `{r['date']}` | "
-            f"Repeat: `{r['repeat']}` | Early: `{r['days_before']}` day(s) | "
-            f"Channel: <#{r['channel_id']}>"
+            f"ID: `{r.id}` | **{r.name}** | Date: `{r.date_str}` | "
+            f"Repeat: `{r.repeat}` | Early: `{r.days_before}` day(s) | "
+            f"Channel: <#{r.channel_id}>"
         )
 
     msg = "📝 **Your reminders:**\n" + "\n".join(lines)
@@ -187,12 +567,7 @@ async def slash_myreminders(interaction: discord.Interaction):
 @app_commands.describe(reminder_id="The ID of the reminder to delete")
 async def slash_delreminder(interaction: discord.Interaction, reminder_id: int):
     user_id = interaction.user.id
-    found = None
-
-    for r in reminders:
-        if r.get("id") == reminder_id:
-            found = r
-            break
+    found = reminders.get(reminder_id)
 
     if found is None:
         await interaction.response.send_message(
@@ -200,88 +575,163 @@ async def slash_delreminder(interaction: discord.Interaction, reminder_id: int):
         )
         return
 
-    if found.get("author_id") != user_id:
+    if found.author_id != user_id:
         await interaction.response.send_message(
             "❌ You can only delete your **own** reminders.", ephemeral=True
         )
         return
 
-    reminders.remove(found)
-    save_reminders(reminders)
+    del reminders[reminder_id]
+    _unindex_reminder(found)
+    journal_delete(found)
 
     await interaction.response.send_message(
-        f"🗑️ Reminder ID `{reminder_id}` (**{found['name']}**) deleted.",
+        f"🗑️ Reminder ID `{reminder_id}` (**{found.name}**) deleted.",
         ephemeral=True,
     )
 
 
 # ================== REMINDER LOOP ==================
 
-@tasks.loop(minutes=1)
-async def reminder_loop():
-    today = date.today()
-    to_remove = []
+DISCORD_MESSAGE_LIMIT = 2000
+
 
-    for rem in reminders:
+def _chunk_lines(lines, limit=DISCORD_MESSAGE_LIMIT):
+    """
+    Join lines into as few messages as possible, each at most `limit` chars.
+    Returns (text, number of lines in it) pairs. A line longer than `limit`
+    is cut short so Discord still accepts it.
+    """
+    chunks = []
+    current = []
+    size = 0
+    for line in lines:
+        if len(line) > limit:
+            line = line[:limit - 1] + "…"
+        extra = len(line) + 1 if current else len(line)
+        if current and size + extra > limit:
+            chunks.append(("\n".join(current), len(current)))
+            current = []
+            extra = len(line)
+            size = 0
+        current.append(line)
+        size += extra
+    if current:
+        chunks.append(("\n".join(current), len(current)))
+    return chunks
+
+
+async def _send_chunks(channel, lines):
+    """
+    Send lines to channel, batched. Returns one bool per line telling
+    whether it was delivered; a failed chunk doesn't stop the rest.
+    """
+    delivered = []
+    for text, count in _chunk_lines(lines):
         try:
-            event_date = datetime.strptime(rem["date"], "%Y-%m-%d").date()
-        except ValueError:
-            continue
+            await channel.send(text)
+            ok = True
+        except Exception as e:
+            print(f"Error sending reminders to channel {channel.id}: {e}")
+            ok = False
+        delivered.extend([ok] * count)
+    return delivered
+
+
+async def _dispatch_for(today):
+    to_remove = []
 
-        days_before = rem.get("days_before", 0)
-        repeat = rem.get("repeat", "once")
-        name = rem.get("name", "Unnamed event")
+    # Messages are collected per channel and sent together after the scan.
+    # sending[channel_id] holds the (reminder, trigger, is_early) of each line.
+    outbox = defaultdict(list)
+    sending = defaultdict(list)
+    # Resolved channels (None if not found), looked up once per channel
+    channels = {}
 
-        channel = bot.get_channel(rem["channel_id"])
+    # Only reminders with a trigger today are looked at
+    due = _due_reminders(today)
+    if not due:
+        return
+
+    for rem, trigger, early in due:
+        channel_id = rem.channel_id
+        if channel_id in channels:
+            channel = channels[channel_id]
+        else:
+            channel = channels[channel_id] = bot.get_channel(channel_id)
         if channel is None:
+            # Not in the cache yet (or gone); retry later today like a
+            # failed send instead of using up the trigger
+            heapq.heappush(_schedule, (trigger, rem.id, early))
             continue
 
-        author_id = rem.get("author_id")
-        mention = f"<@{author_id}>" if author_id else ""
-
-        # ONCE reminders
-        if repeat == "once":
-            # early reminder
-            if days_before > 0:
-                early_day = event_date - timedelta(days=days_before)
-                if today == early_day:
-                    await channel.send(
-                        f"⏰ {mention} Early reminder "
-                        f"({days_before} days ahead): **{name}** on **{event_date.isoformat()}**"
-                    )
-
-            # day-of reminder
-            if today == event_date:
-                await channel.send(
-                    f"🎉 {mention} Today is **{name}**! (**{event_date.isoformat()}**)"
-                )
-                to_remove.append(rem)
+        # early reminder
+        if early:
+            text = rem.early_text
+            event_date = trigger + timedelta(days=rem.days_before)
 
-        # YEARLY reminders
-        elif repeat == "yearly":
-            this_year_date = date(today.year, event_date.month, event_date.day)
-
-            # early reminder
-            if days_before > 0:
-                early_day = this_year_date - timedelta(days=days_before)
-                if today == early_day:
-                    await channel.send(
-                        f"⏰ {mention} Early reminder "
-                        f"({days_before} days ahead): **{name}** on **{this_year_date.isoformat()}**"
-                    )
-
-            # day-of reminder
-            if today == this_year_date:
-                await channel.send(
-                    f"🎉 {mention} Today is **{name}**! (**{this_year_date.isoformat()}**)"
-                )
+        # day-of reminder
+        else:
+            text = rem.day_text
+            event_date = trigger
+
+        outbox[channel_id].append(text.format(date=event_date.isoformat()))
+        sending[channel_id].append((rem, trigger, early))
+
+    # Channels are independent, so send to all of them at once.
+    # Chunks for the same channel are still sent in order.
+    channel_ids = list(outbox)
+    results = await asyncio.gather(
+        *(_send_chunks(channels[cid], outbox[cid]) for cid in channel_ids),
+        return_exceptions=True,
+    )
+    for channel_id, result in zip(channel_ids, results):
+        if isinstance(result, Exception):
+            print(f"Error sending reminders to channel {channel_id}: {result}")
+            result = [False] * len(sending[channel_id])
+
+        for (rem, trigger, early), delivered in zip(sending[channel_id], result):
+            if not delivered:
+                # Put it back, reminder_loop retries it later today
+                heapq.heappush(_schedule, (trigger, rem.id, early))
+            elif rem.repeat == "once" and not early:
+                to_remove.append(rem)
+            else:
+                _reschedule(rem, early, trigger)
 
     # Delete one-time reminders that already triggered
-    if to_remove:
-        for rem in to_remove:
-            if rem in reminders:
-                reminders.remove(rem)
-        save_reminders(reminders)
+    for rem in to_remove:
+        # May already be gone if deleted while the messages were sending
+        if reminders.pop(rem.id, None) is None:
+            continue
+        _unindex_reminder(rem)
+        journal_delete(rem)
+
+
+# Set when a reminder added mid-day has a trigger today
+_wakeup = asyncio.Event()
+# Seconds to wait before retrying reminders that failed to send
+RETRY_DELAY = 60
+
+
+@tasks.loop()
+async def reminder_loop():
+    _wakeup.clear()
+    # Taken before dispatching: if sending runs past midnight, the sleep
+    # below must end right away rather than skip the whole new day
+    today = date.today()
+    await _dispatch_for(today)
+
+    # Reminders are day-granular, so sleep until the next midnight, or
+    # less if some of today's reminders failed and are waiting for a retry
+    next_midnight = datetime.combine(today + timedelta(days=1), time.min)
+    timeout = max((next_midnight - datetime.now()).total_seconds(), 0)
+    if _schedule and _schedule[0][0] <= today:
+        timeout = min(timeout, RETRY_DELAY)
+    try:
+        await asyncio.wait_for(_wakeup.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
 
 
 @reminder_loop.before_loop
@@ -289,6 +739,26 @@ async def before_reminder_loop():
     await bot.wait_until_ready()
 
 
+# ================== JOURNAL WRITER ==================
+
+@tasks.loop()
+async def journal_writer():
+    await _dirty.wait()
+    # Give other changes a moment to arrive so they share one write
+    await asyncio.sleep(SAVE_DELAY)
+    _dirty.clear()
+    try:
+        await flush_journal()
+    except Exception as e:
+        print(f"Error saving reminders, retrying in {SAVE_RETRY_DELAY}s: {e}")
+        # Back off, then flush again even if nothing else changes
+        await asyncio.sleep(SAVE_RETRY_DELAY)
+        _dirty.set()
+
+
 # ================== RUN BOT ==================
 
 bot.run(token)
+
+# Fold the journal back into the snapshot on shutdown
+save_reminders(reminders.values())